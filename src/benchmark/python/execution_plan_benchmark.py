@@ -0,0 +1,69 @@
+#  This file is part of PyBuilder
+#
+#  Copyright 2011-2014 PyBuilder Team
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+    Measures how long it takes to build the execution plan for a generated
+    task graph.
+
+    Usage: python execution_plan_benchmark.py [number of tasks]
+"""
+
+import random
+import sys
+
+from pybuilder.core import Logger
+from pybuilder.execution import ExecutionManager, Task
+from pybuilder.utils import Timer
+
+DEFAULT_NUMBER_OF_TASKS = 50000
+MAX_DEPENDENCIES_PER_TASK = 4
+
+
+def task_callable():
+    pass
+
+
+def generate_tasks(number_of_tasks, seed=42):
+    generator = random.Random(seed)
+    tasks = []
+    for number in range(number_of_tasks):
+        dependencies = ["task_%d" % generator.randrange(number)
+                        for _ in range(min(number, generator.randint(0, MAX_DEPENDENCIES_PER_TASK)))]
+        tasks.append(Task("task_%d" % number, task_callable, dependencies))
+    return tasks
+
+
+def measure(description, function, *arguments):
+    timer = Timer.start()
+    result = function(*arguments)
+    timer.stop()
+    print("{0:>30}: {1:>6} ms".format(description, timer.get_millis()))
+    return result
+
+
+def main(number_of_tasks):
+    execution_manager = ExecutionManager(Logger())
+
+    tasks = measure("generate %d tasks" % number_of_tasks, generate_tasks, number_of_tasks)
+    measure("register tasks", execution_manager.register_task, *tasks)
+    measure("resolve dependencies", execution_manager.resolve_dependencies)
+    execution_plan = measure("build execution plan", execution_manager.build_execution_plan,
+                             ["task_%d" % number for number in range(number_of_tasks - 1, -1, -1)])
+
+    assert len(execution_plan) == number_of_tasks
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUMBER_OF_TASKS)
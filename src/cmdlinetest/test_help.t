@@ -26,6 +26,12 @@ Usage:
     --start-project       Initialize a build descriptor and python project
                           structure.
     -v, --verbose         Enable verbose output
+    -j <number of jobs>, --jobs=<number of jobs>
+                          Execute up to the given number of independent tasks in
+                          parallel
+    --rebuild             Execute all tasks, even those whose inputs and outputs
+                          have not changed
+    --cache-stats         Print statistics of the build cache
   
     Project Options:
       Customizes the project to build.
@@ -0,0 +1,284 @@
+#  This file is part of PyBuilder
+#
+#  Copyright 2011-2014 PyBuilder Team
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+    The PyBuilder cache module.
+    Provides a content-addressed store, shared by all builds of a user, holding
+    the outputs of cacheable tasks and actions.
+"""
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+
+from pybuilder.utils import hash_file
+
+BUILD_CACHE_DIR_PROPERTY = "build_cache_dir"
+BUILD_CACHE_MAX_SIZE_PROPERTY = "build_cache_max_size_mb"
+
+DEFAULT_MAX_SIZE_MB = 1024
+
+# Objects not referenced by any entry may belong to an entry that is being
+# stored by a concurrent build, so they are only removed once they are older.
+ORPHANED_OBJECT_GRACE_PERIOD_SECONDS = 3600
+
+STATISTICS_COUNTERS = ("hits", "misses", "stores", "evictions")
+
+
+def default_cache_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pybuilder")
+
+
+def _makedirs(directory):
+    try:
+        os.makedirs(directory)
+    except OSError:
+        if not os.path.isdir(directory):
+            raise
+
+
+def _rename(source, target):
+    try:
+        os.rename(source, target)
+    except OSError:
+        if not os.path.exists(target):
+            raise
+        os.remove(target)
+        os.rename(source, target)
+
+
+def _write_atomically(file_name, content):
+    directory = os.path.dirname(file_name)
+    _makedirs(directory)
+    handle, temp_file_name = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(handle, "w") as temp_file:
+            temp_file.write(content)
+        _rename(temp_file_name, file_name)
+    except:
+        if os.path.exists(temp_file_name):
+            os.remove(temp_file_name)
+        raise
+
+
+def _copy_atomically(source, target):
+    directory = os.path.dirname(target)
+    _makedirs(directory)
+    handle, temp_file_name = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    os.close(handle)
+    try:
+        shutil.copyfile(source, temp_file_name)
+        _rename(temp_file_name, target)
+    except:
+        if os.path.exists(temp_file_name):
+            os.remove(temp_file_name)
+        raise
+
+
+class BuildCache(object):
+    """
+    Stores files by the SHA-1 hash of their content in objects/ and, for every
+    cache key, a JSON entry in entries/ mapping the paths of the stored files,
+    relative to the project directory, to their objects.
+
+    Restoring an entry marks it as used. Once the objects exceed the size budget
+    the least recently used entries and the objects only they reference are
+    evicted. Several builds may share a cache: entries and objects are written
+    atomically and a missing object is treated as a cache miss.
+    """
+
+    def __init__(self, directory=None, max_size_mb=DEFAULT_MAX_SIZE_MB):
+        self.directory = directory or default_cache_dir()
+        self.max_size = int(max_size_mb) * 1024 * 1024
+        self.objects_dir = os.path.join(self.directory, "objects")
+        self.entries_dir = os.path.join(self.directory, "entries")
+        self.statistics_file = os.path.join(self.directory, "statistics.json")
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def for_project(project):
+        return BuildCache(project.get_property(BUILD_CACHE_DIR_PROPERTY) or None,
+                          project.get_property(BUILD_CACHE_MAX_SIZE_PROPERTY, DEFAULT_MAX_SIZE_MB))
+
+    def object_file(self, object_hash):
+        return os.path.join(self.objects_dir, object_hash[:2], object_hash)
+
+    def entry_file(self, key):
+        return os.path.join(self.entries_dir, key + ".json")
+
+    def _load_entry(self, entry_file):
+        try:
+            with open(entry_file) as entry:
+                return json.load(entry)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def store(self, key, basedir, file_names):
+        """
+        Stores the given files, relative to basedir, as the entry for the given key.
+        """
+        files = {}
+        for file_name in file_names:
+            path = os.path.join(basedir, file_name)
+            object_hash = hash_file(path)
+            object_file = self.object_file(object_hash)
+            if not os.path.exists(object_file):
+                _copy_atomically(path, object_file)
+            files[file_name] = {"object": object_hash, "mode": stat.S_IMODE(os.stat(path).st_mode)}
+
+        _write_atomically(self.entry_file(key), json.dumps({"created": time.time(), "files": files}, indent=2))
+        self._count("stores")
+        self.evict()
+
+    def lookup(self, key):
+        """
+        Returns the entry for the given key or None if there is no complete entry for it.
+        """
+        entry = self._load_entry(self.entry_file(key))
+        if entry is None or not all(os.path.exists(self.object_file(record["object"]))
+                                    for record in entry["files"].values()):
+            self._count("misses")
+            return None
+        return entry
+
+    def restore(self, key, entry, basedir):
+        """
+        Restores the files of the given entry, looked up for the given key, below basedir.
+        Returns False if an object has been evicted in the meantime.
+        """
+        try:
+            for file_name, record in sorted(entry["files"].items()):
+                target = os.path.join(basedir, file_name)
+                _makedirs(os.path.dirname(target))
+                shutil.copyfile(self.object_file(record["object"]), target)
+                os.chmod(target, record["mode"])
+            os.utime(self.entry_file(key), None)
+        except (IOError, OSError):
+            self._count("misses")
+            return False
+
+        self._count("hits")
+        return True
+
+    def _object_sizes(self):
+        sizes = {}
+        if not os.path.isdir(self.objects_dir):
+            return sizes
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            for object_hash in os.listdir(prefix_dir):
+                if object_hash.startswith(".tmp-"):
+                    continue
+                try:
+                    object_stat = os.stat(os.path.join(prefix_dir, object_hash))
+                except OSError:
+                    continue
+                sizes[object_hash] = (object_stat.st_size, object_stat.st_mtime)
+        return sizes
+
+    def _entries(self):
+        entries = []
+        if not os.path.isdir(self.entries_dir):
+            return entries
+        for file_name in os.listdir(self.entries_dir):
+            if not file_name.endswith(".json"):
+                continue
+            entry_file = os.path.join(self.entries_dir, file_name)
+            entry = self._load_entry(entry_file)
+            try:
+                last_used = os.stat(entry_file).st_mtime
+            except OSError:
+                continue
+            if entry is not None:
+                objects = set([record["object"] for record in entry["files"].values()])
+                entries.append((last_used, entry_file, objects))
+        return entries
+
+    def _remove(self, file_name):
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the objects fit the size budget.
+        Returns the number of evicted entries.
+        """
+        with self._lock:
+            object_sizes = self._object_sizes()
+            entries = sorted(self._entries())
+
+            references = {}
+            for _, _, objects in entries:
+                for object_hash in objects:
+                    references[object_hash] = references.get(object_hash, 0) + 1
+
+            now = time.time()
+            size = 0
+            for object_hash, (object_size, modified) in object_sizes.items():
+                if object_hash in references:
+                    size += object_size
+                elif now - modified > ORPHANED_OBJECT_GRACE_PERIOD_SECONDS:
+                    self._remove(self.object_file(object_hash))
+
+            evictions = 0
+            while size > self.max_size and entries:
+                _, entry_file, objects = entries.pop(0)
+                self._remove(entry_file)
+                evictions += 1
+                for object_hash in objects:
+                    references[object_hash] -= 1
+                    if not references[object_hash]:
+                        self._remove(self.object_file(object_hash))
+                        size -= object_sizes.get(object_hash, (0, 0))[0]
+
+            if evictions:
+                self._count("evictions", evictions)
+            return evictions
+
+    def _load_statistics(self):
+        try:
+            with open(self.statistics_file) as statistics_file:
+                return json.load(statistics_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _count(self, counter, increment=1):
+        with self._lock:
+            statistics = self._load_statistics()
+            statistics[counter] = statistics.get(counter, 0) + increment
+            _write_atomically(self.statistics_file, json.dumps(statistics, indent=2, sort_keys=True))
+
+    def statistics(self):
+        """
+        Returns the counters accumulated by all builds using this cache together with
+        the number of entries and the size of the stored objects.
+        """
+        statistics = dict((counter, 0) for counter in STATISTICS_COUNTERS)
+        statistics.update(self._load_statistics())
+
+        object_sizes = self._object_sizes()
+        statistics["directory"] = self.directory
+        statistics["entries"] = len(self._entries())
+        statistics["objects"] = len(object_sizes)
+        statistics["size"] = sum([object_size for object_size, _ in object_sizes.values()])
+        statistics["max_size"] = self.max_size
+        return statistics
@@ -25,6 +25,7 @@ import sys
 import traceback
 
 from pybuilder import __version__
+from pybuilder.cache import BuildCache
 from pybuilder.core import Logger
 from pybuilder.errors import PyBuilderException
 from pybuilder.execution import ExecutionManager
@@ -102,6 +103,26 @@ def parse_options(args):
                       default=False,
                       help="Enable verbose output")
 
+    parser.add_option("-j", "--jobs",
+                      action="store",
+                      type="int",
+                      dest="jobs",
+                      default=1,
+                      metavar="<number of jobs>",
+                      help="Execute up to the given number of independent tasks in parallel")
+
+    parser.add_option("--rebuild",
+                      action="store_true",
+                      dest="rebuild",
+                      default=False,
+                      help="Execute all tasks, even those whose inputs and outputs have not changed")
+
+    parser.add_option("--cache-stats",
+                      action="store_true",
+                      dest="cache_stats",
+                      default=False,
+                      help="Print statistics of the build cache")
+
     project_group = optparse.OptionGroup(
         parser, "Project Options", "Customizes the project to build.")
 
@@ -162,6 +183,9 @@ def parse_options(args):
 
     options.property_overrides = property_overrides
 
+    if options.jobs < 1:
+        parser.error("The number of jobs must be at least 1.")
+
     if options.very_quiet:
         options.quiet = True
 
@@ -280,6 +304,25 @@ def print_list_of_tasks(reactor):
             print_text_line(whitespace + depends_on_message)
 
 
+def format_megabytes(size):
+    return "{0:.1f} MB".format(size / (1024.0 * 1024.0))
+
+
+def print_build_cache_statistics(build_cache):
+    statistics = build_cache.statistics()
+    lookups = statistics["hits"] + statistics["misses"]
+    hit_rate = 100.0 * statistics["hits"] / lookups if lookups else 0.0
+
+    print_text_line("Build cache in {0}:".format(statistics["directory"]))
+    print_text_line("    Entries: {0} ({1} objects)".format(statistics["entries"], statistics["objects"]))
+    print_text_line("       Size: {0} of {1}".format(format_megabytes(statistics["size"]),
+                                                     format_megabytes(statistics["max_size"])))
+    print_text_line("       Hits: {0} ({1:.1f}%)".format(statistics["hits"], hit_rate))
+    print_text_line("     Misses: {0}".format(statistics["misses"]))
+    print_text_line("     Stores: {0}".format(statistics["stores"]))
+    print_text_line("  Evictions: {0}".format(statistics["evictions"]))
+
+
 def main(*args):
     try:
         options, arguments = parse_options(args)
@@ -303,6 +346,20 @@ def main(*args):
         print_list_of_tasks(reactor)
         return 0
 
+    if options.cache_stats:
+        try:
+            reactor.prepare_build(property_overrides=options.property_overrides,
+                                  project_directory=options.project_directory)
+            reactor.execution_manager.execute_initializers(
+                options.environments, logger=logger, project=reactor.project)
+            build_cache = BuildCache.for_project(reactor.project)
+        except PyBuilderException as e:
+            logger.debug("Using default build cache: %s", e)
+            build_cache = BuildCache()
+
+        print_build_cache_statistics(build_cache)
+        return 0
+
     if not options.very_quiet:
         print_styled_text_line(
             "PyBuilder version {0}".format(__version__), options, BOLD)
@@ -324,7 +381,8 @@ def main(*args):
                 reactor.project.set_property("verbose", True)
 
             summary = reactor.build(
-                environments=options.environments, tasks=arguments)
+                environments=options.environments, tasks=arguments, jobs=options.jobs,
+                incremental=not options.rebuild)
 
         except KeyboardInterrupt:
             raise PyBuilderException("Build aborted")
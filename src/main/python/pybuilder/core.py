@@ -43,6 +43,11 @@ DEPENDS_ATTRIBUTE = "_python_builder_depends"
 
 DESCRIPTION_ATTRIBUTE = "_python_builder_description"
 
+INPUTS_ATTRIBUTE = "_python_builder_inputs"
+INPUT_PROPERTIES_ATTRIBUTE = "_python_builder_input_properties"
+OUTPUTS_ATTRIBUTE = "_python_builder_outputs"
+CACHEABLE_ATTRIBUTE = "_python_builder_cacheable"
+
 
 def init(*possible_callable, **additional_arguments):
     """
@@ -120,6 +125,56 @@ class depends(object):
         return callable
 
 
+class inputs(object):
+    """
+    Decorator for tasks and actions that declares the files and properties they read.
+    Globs are relative to the project's basedir and may reference properties, i.e.
+    "$dir_source_main_python/**.py". A glob naming a directory includes all files below it.
+    Properties may be given as keyword argument "properties", which may also name
+    project attributes such as "summary" or "dependencies".
+
+    Together with outputs this enables PyBuilder to skip the task or action when
+    nothing changed since its last successful execution.
+
+    Example:
+
+    @task
+    @inputs("$dir_source_main_python", properties=["distutils_commands"])
+    @outputs("$dir_dist")
+    def spam(project): pass
+    """
+    def __init__(self, *globs, **keyword_arguments):
+        self._globs = list(globs)
+        self._properties = as_list(keyword_arguments.get("properties"))
+
+    def __call__(self, callable):
+        setattr(callable, INPUTS_ATTRIBUTE, self._globs)
+        setattr(callable, INPUT_PROPERTIES_ATTRIBUTE, self._properties)
+        return callable
+
+
+class outputs(object):
+    """
+    Decorator for tasks and actions that declares the files they produce.
+    Globs follow the same rules as the ones given to inputs.
+
+    Only tasks and actions declaring outputs are skipped when they are up to date.
+
+    Passing cacheable=True stores the outputs in the build cache shared by all builds
+    of the user. Instead of executing the task or action again, its outputs are restored
+    from the cache if the content of its input files and its properties match a previous
+    execution. Only outputs that solely depend on the declared inputs may be cached.
+    """
+    def __init__(self, *globs, **keyword_arguments):
+        self._globs = list(globs)
+        self._cacheable = keyword_arguments.get("cacheable", False)
+
+    def __call__(self, callable):
+        setattr(callable, OUTPUTS_ATTRIBUTE, self._globs)
+        setattr(callable, CACHEABLE_ATTRIBUTE, self._cacheable)
+        return callable
+
+
 class BaseAction(object):
     def __init__(self, attribute, only_once, tasks):
         self.tasks = tasks
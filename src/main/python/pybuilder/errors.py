@@ -47,14 +47,14 @@ class NoSuchTaskException(PyBuilderException):
 
 class CircularTaskDependencyException(PyBuilderException):
 
-    def __init__(self, first, second=None):
-        if second:
-            super(
-                CircularTaskDependencyException, self).__init__("Circular task dependency detected between %s and %s",
-                                                                first,
-                                                                second)
+    def __init__(self, first, second=None, cycle=None):
+        if not cycle:
+            cycle = [first, second, first] if second else [first, first]
+        super(CircularTaskDependencyException, self).__init__("Circular task dependency detected: %s",
+                                                              " -> ".join(cycle))
         self.first = first
         self.second = second
+        self.cycle = cycle
 
 
 class MissingPrerequisiteException(PyBuilderException):
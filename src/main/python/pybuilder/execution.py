@@ -20,8 +20,11 @@
     order regarding dependencies.
 """
 
+import heapq
 import inspect
 import re
+import sys
+import threading
 import types
 
 from pybuilder.errors import (CircularTaskDependencyException,
@@ -44,15 +47,23 @@ def as_task_name_list(mixed):
 
 
 class Executable(object):
+    __slots__ = ("_name", "description", "callable", "inputs", "input_properties", "outputs", "cacheable",
+                 "source", "parameters")
+
     NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]+$")
 
-    def __init__(self, name, callable, description=""):
+    def __init__(self, name, callable, description="", inputs=None, input_properties=None, outputs=None,
+                 cacheable=False):
         if not Executable.NAME_PATTERN.match(name):
             raise InvalidNameException(name)
 
         self._name = name
         self.description = description
         self.callable = callable
+        self.inputs = as_list(inputs)
+        self.input_properties = as_list(input_properties)
+        self.outputs = as_list(outputs)
+        self.cacheable = cacheable
         if hasattr(callable, "__module__"):
             self.source = callable.__module__
         else:
@@ -78,17 +89,23 @@ class Executable(object):
 
 
 class Action(Executable):
-    def __init__(self, name, callable, before=None, after=None, description="", only_once=False):
-        super(Action, self).__init__(name, callable, description)
+    __slots__ = ("execute_before", "execute_after", "only_once")
+
+    def __init__(self, name, callable, before=None, after=None, description="", only_once=False,
+                 inputs=None, input_properties=None, outputs=None, cacheable=False):
+        super(Action, self).__init__(name, callable, description, inputs, input_properties, outputs, cacheable)
         self.execute_before = as_task_name_list(before)
         self.execute_after = as_task_name_list(after)
         self.only_once = only_once
 
 
 class Task(object):
-    def __init__(self, name, callable, dependencies=None, description=""):
+    __slots__ = ("name", "executables", "dependencies", "description")
+
+    def __init__(self, name, callable, dependencies=None, description="",
+                 inputs=None, input_properties=None, outputs=None, cacheable=False):
         self.name = name
-        self.executables = [Executable(name, callable, description)]
+        self.executables = [Executable(name, callable, description, inputs, input_properties, outputs, cacheable)]
         self.dependencies = as_task_name_list(dependencies)
         self.description = [description]
 
@@ -117,6 +134,8 @@ class Task(object):
 
 
 class Initializer(Executable):
+    __slots__ = ("environments",)
+
     def __init__(self, name, callable, environments=None, description=""):
         super(Initializer, self).__init__(name, callable, description)
         self.environments = environments
@@ -151,6 +170,9 @@ class ExecutionManager(object):
 
         self._dependencies_resolved = False
         self._actions_executed = []
+        self._only_once_lock = threading.RLock()
+
+        self.incremental_build = None
 
     @property
     def initializers(self):
@@ -202,31 +224,59 @@ class ExecutionManager(object):
                           task.name)
 
         timer = Timer.start()
+
+        if self.incremental_build:
+            self.incremental_build.begin_task()
+            try:
+                number_of_actions = self._execute_task_and_actions(task, keywordArguments)
+            except:
+                self.incremental_build.abort_task()
+                raise
+            self.incremental_build.finish_task()
+        else:
+            number_of_actions = self._execute_task_and_actions(task, keywordArguments)
+
+        timer.stop()
+        return TaskExecutionSummary(task.name, number_of_actions, timer.get_millis())
+
+    def _execute_task_and_actions(self, task, arguments):
         number_of_actions = 0
 
         for action in self._execute_before[task.name]:
-            if self.execute_action(action, keywordArguments):
+            if self.execute_action(action, arguments):
                 number_of_actions += 1
 
-        task.execute(self.logger, keywordArguments)
+        if self.incremental_build:
+            self.incremental_build.execute_task(task, arguments)
+        else:
+            task.execute(self.logger, arguments)
 
         for action in self._execute_after[task.name]:
-            if self.execute_action(action, keywordArguments):
+            if self.execute_action(action, arguments):
                 number_of_actions += 1
 
-        timer.stop()
-        return TaskExecutionSummary(task.name, number_of_actions, timer.get_millis())
+        return number_of_actions
 
     def execute_action(self, action, arguments):
-        if action.only_once and action in self._actions_executed:
-            message = "Action %s has been executed before and is marked as only_once, so will not be executed again"
-            self.logger.debug(message, action.name)
-            return False
+        if not action.only_once:
+            return self._execute_action(action, arguments)
+
+        with self._only_once_lock:
+            if action in self._actions_executed:
+                message = "Action %s has been executed before and is marked as only_once, so will not be executed again"
+                self.logger.debug(message, action.name)
+                return False
+            return self._execute_action(action, arguments)
 
+    def _execute_action(self, action, arguments):
         self.logger.debug("Executing action '%s' from '%s' before task", action.name, action.source)
-        action.execute(arguments)
+        executed = True
+        if self.incremental_build:
+            executed = self.incremental_build.execute(action, arguments)
+        else:
+            action.execute(arguments)
         self._actions_executed.append(action)
-        return True
+        return executed
 
     def execute_execution_plan(self, execution_plan, **keywordArguments):
         self.assert_dependencies_resolved()
@@ -238,6 +288,86 @@ class ExecutionManager(object):
 
         return summaries
 
+    def execute_execution_plan_in_parallel(self, execution_plan, jobs, **keywordArguments):
+        """
+        Executes the given execution plan using up to jobs worker threads.
+
+        A task is started as soon as all of its dependencies contained in the
+        plan have been executed successfully. Tasks that do not depend on each
+        other may run concurrently, so the order of the command line is not
+        preserved for them.
+        If a task fails, no further tasks are started and the first error is
+        raised once all running tasks have finished.
+        Summaries are returned in the order of the execution plan.
+        """
+        self.assert_dependencies_resolved()
+
+        if jobs <= 1 or len(execution_plan) <= 1:
+            return self.execute_execution_plan(execution_plan, **keywordArguments)
+
+        positions = dict((task.name, position) for position, task in enumerate(execution_plan))
+        pending_dependencies = {}
+        dependents = dict((task.name, []) for task in execution_plan)
+        ready_positions = []
+        for position, task in enumerate(execution_plan):
+            dependencies = set([dependency.name
+                                for dependency in self._task_dependencies[task.name]
+                                if dependency.name in positions])
+            pending_dependencies[task.name] = dependencies
+            for dependency in dependencies:
+                dependents[dependency].append(task.name)
+            if not dependencies:
+                ready_positions.append(position)
+
+        condition = threading.Condition()
+        summaries = {}
+        failures = []
+        unstarted = [len(execution_plan)]
+
+        def work():
+            while True:
+                with condition:
+                    while not failures and not ready_positions and unstarted[0]:
+                        condition.wait()
+                    if failures or not ready_positions:
+                        return
+                    task = execution_plan[heapq.heappop(ready_positions)]
+                    unstarted[0] -= 1
+
+                try:
+                    summary = self.execute_task(task, **keywordArguments)
+                except BaseException:
+                    with condition:
+                        failures.append(sys.exc_info()[1])
+                        condition.notify_all()
+                    return
+
+                with condition:
+                    summaries[task.name] = summary
+                    for dependent in dependents[task.name]:
+                        pending_dependencies[dependent].discard(task.name)
+                        if not pending_dependencies[dependent]:
+                            heapq.heappush(ready_positions, positions[dependent])
+                    condition.notify_all()
+
+        number_of_workers = min(jobs, len(execution_plan))
+        self.logger.debug("Executing %d tasks using %d workers", len(execution_plan), number_of_workers)
+
+        workers = []
+        for number in range(number_of_workers):
+            worker = threading.Thread(target=work, name="pybuilder-worker-%d" % number)
+            worker.daemon = True
+            workers.append(worker)
+            worker.start()
+
+        for worker in workers:
+            worker.join()
+
+        if failures:
+            raise failures[0]
+
+        return [summaries[task.name] for task in execution_plan]
+
     def get_task(self, name):
         return self._tasks[name]
 
@@ -248,32 +378,50 @@ class ExecutionManager(object):
         self.assert_dependencies_resolved()
 
         execution_plan = []
+        enqueued_task_names = set()
         for name in as_list(task_names):
-            self.enqueue_task(execution_plan, name)
+            self.enqueue_task(execution_plan, name, enqueued_task_names)
         return execution_plan
 
-    def enqueue_task(self, execution_plan, task_name, circular_check=None):
-        if not self.has_task(task_name):
-            raise NoSuchTaskException(task_name)
+    def enqueue_task(self, execution_plan, task_name, enqueued_task_names=None):
+        """
+        Appends the task with the given name to the execution plan, preceded by all of its
+        transitive dependencies not yet contained in it.
 
-        task = self.get_task(task_name)
+        The dependency graph is walked depth first without recursion, so each task and
+        dependency is visited once. enqueued_task_names holds the names of the tasks
+        contained in the plan and is updated accordingly.
+        """
+        if enqueued_task_names is None:
+            enqueued_task_names = set([task.name for task in execution_plan])
 
-        if task == circular_check:
-            raise CircularTaskDependencyException(task.name)
+        if not self.has_task(task_name):
+            raise NoSuchTaskException(task_name)
 
-        if task in execution_plan:
+        if task_name in enqueued_task_names:
             return
 
-        try:
-            for dependency in self._task_dependencies[task.name]:
-                self.enqueue_task(execution_plan, dependency.name,
-                                  circular_check=circular_check if circular_check else task)
-        except CircularTaskDependencyException as e:
-            if e.second:
-                raise
-            raise CircularTaskDependencyException(e.first, task.name)
-
-        execution_plan.append(task)
+        path = [task_name]
+        names_on_path = set(path)
+        stack = [iter(self._task_dependencies[task_name])]
+
+        while stack:
+            for dependency in stack[-1]:
+                if dependency.name in names_on_path:
+                    cycle = path[path.index(dependency.name):] + [dependency.name]
+                    raise CircularTaskDependencyException(cycle[0], cycle[-2], cycle)
+
+                if dependency.name not in enqueued_task_names:
+                    path.append(dependency.name)
+                    names_on_path.add(dependency.name)
+                    stack.append(iter(self._task_dependencies[dependency.name]))
+                    break
+            else:
+                stack.pop()
+                name = path.pop()
+                names_on_path.discard(name)
+                enqueued_task_names.add(name)
+                execution_plan.append(self.get_task(name))
 
     def resolve_dependencies(self):
         for task in self._tasks.values():
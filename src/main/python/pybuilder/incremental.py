@@ -0,0 +1,334 @@
+#  This file is part of PyBuilder
+#
+#  Copyright 2011-2014 PyBuilder Team
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+    The PyBuilder incremental module.
+    Skips tasks and actions whose declared inputs and outputs have not changed
+    since their last successful execution.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+
+from pybuilder.errors import MissingPropertyException
+from pybuilder.utils import GlobExpression, hash_file, mkdir
+
+STATE_FILE_NAME = "build_state.json"
+
+PROPERTY_REFERENCE_PATTERN = re.compile(r"\$(?:([_a-zA-Z][_a-zA-Z0-9]*)|\{([_a-zA-Z][_a-zA-Z0-9]*)\})")
+WILDCARD_PATTERN = re.compile(r"[*?\[]")
+
+
+def expand_globs(project, glob):
+    """
+    Expands the properties referenced in the given glob.
+    Each reference to a list-valued property results in one glob per list element.
+    """
+    for match in PROPERTY_REFERENCE_PATTERN.finditer(glob):
+        value = project.get_property(match.group(1) or match.group(2))
+        if isinstance(value, (list, tuple)):
+            result = []
+            for element in value:
+                result += expand_globs(project, glob[:match.start()] + element + glob[match.end():])
+            return result
+    return [project.expand(glob)]
+
+
+def discover_files_matching_glob(basedir, glob):
+    """
+    Returns the paths, relative to basedir, of all files matching the given glob.
+    A glob without wildcards naming a directory matches all files below it.
+    """
+    glob = glob.replace(os.sep, "/")
+    if os.path.isabs(glob):
+        glob = os.path.relpath(glob, basedir).replace(os.sep, "/")
+
+    literal_parts = []
+    for part in glob.split("/"):
+        if WILDCARD_PATTERN.search(part):
+            break
+        literal_parts.append(part)
+
+    start = os.path.join(basedir, *literal_parts)
+    if len(literal_parts) == len(glob.split("/")):
+        if os.path.isfile(start):
+            return [glob]
+        expression = None
+    else:
+        expression = GlobExpression(glob)
+
+    result = []
+    for root, _, file_names in os.walk(start):
+        for file_name in file_names:
+            relative_file_name = os.path.relpath(os.path.join(root, file_name), basedir).replace(os.sep, "/")
+            if expression is None or expression.matches(relative_file_name):
+                result.append(relative_file_name)
+    return result
+
+
+def files_matching_globs(project, globs):
+    """
+    Returns the paths, relative to the project's basedir, of all files matching the given globs.
+    Globs referencing missing properties are ignored.
+    """
+    result = []
+    for glob in globs:
+        try:
+            expanded_globs = expand_globs(project, glob)
+        except MissingPropertyException:
+            continue
+        for expanded_glob in expanded_globs:
+            result += discover_files_matching_glob(project.basedir, expanded_glob)
+    return sorted(set(result))
+
+
+def stat_file(file_name):
+    stat = os.stat(file_name)
+    return [stat.st_size, stat.st_mtime]
+
+
+def fingerprint_files(project, globs, fingerprint_file=stat_file):
+    fingerprint = {}
+    for glob in globs:
+        try:
+            expanded_globs = expand_globs(project, glob)
+        except MissingPropertyException:
+            fingerprint[glob] = None
+            continue
+
+        for expanded_glob in expanded_globs:
+            for file_name in discover_files_matching_glob(project.basedir, expanded_glob):
+                try:
+                    fingerprint[file_name] = fingerprint_file(os.path.join(project.basedir, file_name))
+                except (IOError, OSError):
+                    continue
+    return fingerprint
+
+
+def _to_json(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted([json.dumps(element, sort_keys=True, default=_to_json) for element in value])
+    if hasattr(value, "__dict__"):
+        return value.__dict__
+    return repr(value)
+
+
+def fingerprint_properties(project, names):
+    fingerprint = {}
+    for name in names:
+        if project.has_property(name):
+            value = project.get_property(name)
+        else:
+            value = getattr(project, name, None)
+        fingerprint[name] = json.dumps(value, sort_keys=True, default=_to_json)
+    return fingerprint
+
+
+def digest(fingerprint):
+    return hashlib.sha1(json.dumps(fingerprint, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def source_file_of(executable):
+    module = sys.modules.get(executable.source)
+    return getattr(module, "__file__", None)
+
+
+class IncrementalBuild(object):
+    """
+    Executes tasks and actions unless their inputs and outputs match the
+    fingerprints recorded after their last successful execution.
+
+    The inputs fingerprint consists of the size and modification time of all files
+    matching the declared input globs, the values of the declared properties, the
+    name and version of the project and the source file of the executable.
+    The outputs are recorded as the size and modification time of each file matching
+    the declared output globs; they are up to date if none of these files has been
+    changed or removed. Files added to output directories later on, i.e. by a
+    distutils command, do not invalidate them.
+
+    Fingerprints are recorded once the task an executable belongs to has finished
+    successfully, so changes done by later actions of the same task do not
+    invalidate them. Only executables declaring outputs are ever skipped.
+
+    Given a build cache, the outputs of cacheable executables are stored in it
+    right after their execution, keyed by the content of their input files, their
+    properties, project name and version, source file and the Python version.
+    Executables which are not up to date restore their outputs from the cache
+    instead of being executed if the cache holds an entry for their key.
+    """
+
+    def __init__(self, logger, project, state_file=None, build_cache=None):
+        self.logger = logger
+        self.project = project
+        self.build_cache = build_cache
+        self.state_file = state_file or project.expand_path("$dir_target", STATE_FILE_NAME)
+        self._state = None
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state is None:
+                self._state = self._load_state()
+            return self._state
+
+    def _load_state(self):
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file) as state_file:
+                return json.load(state_file)
+        except ValueError:
+            self.logger.warn("Ignoring corrupt build state %s", self.state_file)
+            return {}
+
+    def save_state(self):
+        with self._lock:
+            mkdir(os.path.dirname(self.state_file))
+            with open(self.state_file, "w") as state_file:
+                json.dump(self.state, state_file, indent=2, sort_keys=True)
+
+    def _pending_records(self):
+        return self._local.pending_records[-1]
+
+    def begin_task(self):
+        if not hasattr(self._local, "pending_records"):
+            self._local.pending_records = []
+        self._local.pending_records.append([])
+
+    def abort_task(self):
+        self._local.pending_records.pop()
+
+    def finish_task(self):
+        records = self._local.pending_records.pop()
+        if not records:
+            return
+
+        with self._lock:
+            for key, executable, inputs_digest in records:
+                self.state[key] = {"inputs": inputs_digest,
+                                   "outputs": fingerprint_files(self.project, executable.outputs)}
+            self.save_state()
+
+    def key_of(self, executable):
+        return "%s:%s:%s" % (executable.__class__.__name__.lower(), executable.source, executable.name)
+
+    def fingerprint_inputs(self, executable):
+        fingerprint = {
+            "files": fingerprint_files(self.project, executable.inputs),
+            "properties": fingerprint_properties(self.project, executable.input_properties),
+            "project": [self.project.name, self.project.version]
+        }
+        source_file = source_file_of(executable)
+        if source_file and os.path.exists(source_file):
+            stat = os.stat(source_file)
+            fingerprint["source"] = [source_file, stat.st_size, stat.st_mtime]
+        return digest(fingerprint)
+
+    def cache_key_of(self, executable):
+        fingerprint = {
+            "executable": self.key_of(executable),
+            "files": fingerprint_files(self.project, executable.inputs, hash_file),
+            "properties": fingerprint_properties(self.project, executable.input_properties),
+            "project": [self.project.name, self.project.version],
+            "python": [sys.platform] + list(sys.version_info[:2])
+        }
+        source_file = source_file_of(executable)
+        if source_file and os.path.exists(source_file):
+            fingerprint["source"] = hash_file(source_file)
+        return digest(fingerprint)
+
+    def restore_from_cache(self, executable, cache_key):
+        entry = self.build_cache.lookup(cache_key)
+        if entry is None:
+            return False
+        try:
+            for file_name in files_matching_globs(self.project, executable.outputs):
+                os.remove(os.path.join(self.project.basedir, file_name))
+            return self.build_cache.restore(cache_key, entry, self.project.basedir)
+        except (IOError, OSError) as e:
+            self.logger.warn("Unable to restore outputs of %s from build cache: %s", executable.name, e)
+            return False
+
+    def store_in_cache(self, executable, cache_key):
+        try:
+            self.build_cache.store(cache_key, self.project.basedir,
+                                   files_matching_globs(self.project, executable.outputs))
+        except (IOError, OSError) as e:
+            self.logger.warn("Unable to store outputs of %s in build cache: %s", executable.name, e)
+
+    def outputs_unchanged(self, recorded_outputs):
+        for file_name, recorded_stat in recorded_outputs.items():
+            if recorded_stat is None:
+                continue
+            try:
+                stat = os.stat(os.path.join(self.project.basedir, file_name))
+            except OSError:
+                return False
+            if [stat.st_size, stat.st_mtime] != recorded_stat:
+                return False
+        return True
+
+    def is_up_to_date(self, executable, inputs_digest):
+        with self._lock:
+            record = self.state.get(self.key_of(executable))
+        if not record or record["inputs"] != inputs_digest:
+            return False
+        return self.outputs_unchanged(record["outputs"])
+
+    def execute(self, executable, argument_dict):
+        """
+        Executes the given executable unless it is up to date.
+        Returns True if the executable has been executed.
+        """
+        if not executable.outputs:
+            executable.execute(argument_dict)
+            return True
+
+        key = self.key_of(executable)
+        inputs_digest = self.fingerprint_inputs(executable)
+
+        if self.is_up_to_date(executable, inputs_digest):
+            self.logger.info("Skipping %s from %s as its inputs and outputs have not changed",
+                             executable.name, executable.source)
+            self._pending_records().append((key, executable, inputs_digest))
+            return False
+
+        with self._lock:
+            self.state.pop(key, None)
+
+        cache_key = None
+        if executable.cacheable and self.build_cache:
+            cache_key = self.cache_key_of(executable)
+            if self.restore_from_cache(executable, cache_key):
+                self.logger.info("Restored outputs of %s from %s from build cache", executable.name, executable.source)
+                self._pending_records().append((key, executable, inputs_digest))
+                return False
+
+        executable.execute(argument_dict)
+        if cache_key:
+            self.store_in_cache(executable, cache_key)
+        self._pending_records().append((key, executable, inputs_digest))
+        return True
+
+    def execute_task(self, task, argument_dict):
+        for executable in task.executables:
+            self.logger.debug("Executing subtask from %s", executable.source)
+            self.execute(executable, argument_dict)
@@ -16,7 +16,7 @@
 
 import string
 
-from pybuilder.core import init, after, use_plugin
+from pybuilder.core import init, after, use_plugin, inputs, outputs
 from pybuilder.utils import apply_on_files, read_file, write_file
 
 use_plugin("core")
@@ -29,6 +29,8 @@ def init_filter_resources_plugin(project):
 
 
 @after("package", only_once=True)
+@inputs(properties=["filter_resources_glob", "filter_resources_target"])
+@outputs("$filter_resources_target/$filter_resources_glob")
 def filter_resources(project, logger):
     globs = project.get_mandatory_property("filter_resources_glob")
     if not globs:
@@ -18,7 +18,7 @@ import os
 import re
 import shutil
 
-from pybuilder.core import init, task, description, use_plugin
+from pybuilder.core import init, task, description, use_plugin, inputs, outputs
 
 HIDDEN_FILE_NAME_PATTERN = re.compile(r'^\..*$')
 
@@ -63,6 +63,9 @@ def init_python_directories(project):
 
 @task
 @description("Package a python application.")
+@inputs("$" + PYTHON_SOURCES_PROPERTY, "$" + SCRIPTS_SOURCES_PROPERTY,
+        properties=[DISTRIBUTION_PROPERTY, SCRIPTS_TARGET_PROPERTY])
+@outputs("$" + DISTRIBUTION_PROPERTY, cacheable=True)
 def package(project, logger):
     init_dist_target(project, logger)
 
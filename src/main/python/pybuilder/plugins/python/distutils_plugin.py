@@ -24,7 +24,7 @@ try:
 except (ImportError) as e:
     from io import StringIO
 
-from pybuilder.core import after, before, use_plugin, init
+from pybuilder.core import after, before, use_plugin, init, inputs, outputs
 from pybuilder.errors import BuildFailedException
 from pybuilder.utils import as_list
 
@@ -79,6 +79,11 @@ def initialize_distutils_plugin(project):
 
 
 @after("package")
+@inputs("$dir_source_main_python", "$dir_source_main_scripts",
+        properties=["distutils_use_setuptools", "distutils_classifiers", "distutils_issue8876_workaround_enabled",
+                    "dir_dist_scripts", "summary", "description", "authors", "license", "url",
+                    "dependencies", "files_to_install", "package_data"])
+@outputs("$dir_dist/setup.py")
 def write_setup_script(project, logger):
     setup_script = project.expand_path("$dir_dist/setup.py")
     logger.info("Writing setup.py as %s", setup_script)
@@ -120,6 +125,8 @@ def render_setup_script(project):
 
 
 @after("package")
+@inputs(properties=["manifest_included_files"])
+@outputs("$dir_dist/MANIFEST.in")
 def write_manifest_file(project, logger):
     if len(project.manifest_included_files) == 0:
         logger.debug("No data to write into MANIFEST.in")
@@ -147,6 +154,9 @@ def render_manifest_file(project):
 
 
 @before("publish")
+@inputs("$dir_source_main_python", "$dir_source_main_scripts", "$dir_dist/setup.py", "$dir_dist/MANIFEST.in",
+        properties=["distutils_commands"])
+@outputs("$dir_dist/dist", "$dir_reports/distutils", cacheable=True)
 def build_binary_distribution(project, logger):
     reports_dir = project.expand_path("$dir_reports/distutils")
     if not os.path.exists(reports_dir):
@@ -23,7 +23,7 @@
 
 __author__ = 'Michael Gruber'
 
-from pybuilder.core import after, task, init, use_plugin, depends
+from pybuilder.core import after, task, init, use_plugin, depends, inputs, outputs
 from pybuilder.errors import BuildFailedException
 from pybuilder.utils import assert_can_execute
 from pybuilder.pluginhelper.external_command import ExternalCommandBuilder
@@ -53,6 +53,10 @@ def assert_flake8_is_executable(logger):
 
 @task
 @depends("prepare")
+@inputs("$dir_source_main_python", "$dir_source_unittest_python", "$dir_source_integrationtest_python",
+        properties=["flake8_break_build", "flake8_max_line_length", "flake8_exclude_patterns",
+                    "flake8_include_test_sources", "flake8_ignore", "flake8_verbose_output", "verbose"])
+@outputs("$dir_reports/flake8", "$dir_reports/flake8.err")
 def analyze(project, logger):
     """ Applies the flake8 script to the sources of the given project. """
     logger.info("Executing flake8 on project sources.")
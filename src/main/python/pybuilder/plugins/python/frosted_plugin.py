@@ -24,7 +24,7 @@
 
 __author__ = 'Maximilien Riehl'
 
-from pybuilder.core import after, task, init, use_plugin, depends
+from pybuilder.core import after, task, init, use_plugin, depends, inputs, outputs
 from pybuilder.errors import BuildFailedException
 from pybuilder.utils import assert_can_execute
 from pybuilder.pluginhelper.external_command import ExternalCommandBuilder
@@ -52,6 +52,10 @@ def assert_frosted_is_executable(logger):
 
 @task
 @depends("prepare")
+@inputs("$dir_source_main_python", "$dir_source_unittest_python", "$dir_source_integrationtest_python",
+        properties=["frosted_break_build", "frosted_include_test_sources", "frosted_ignore",
+                    "frosted_verbose_output", "verbose"])
+@outputs("$dir_reports/frosted", "$dir_reports/frosted.err")
 def analyze(project, logger):
     """ Applies the frosted script to the sources of the given project. """
     logger.info("Executing frosted on project sources.")
@@ -14,7 +14,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from pybuilder.core import use_plugin, task, after, init
+from pybuilder.core import use_plugin, task, after, init, inputs, outputs
 from pybuilder.utils import assert_can_execute, read_file
 from pybuilder.plugins.python.python_plugin_helper import execute_tool_on_source_files
 
@@ -33,6 +33,8 @@ def check_pep8_available(logger):
 
 
 @task
+@inputs("$dir_source_main_python", properties=["pep8_verbose_output"])
+@outputs("$dir_reports/pep8", "$dir_reports/pep8.err")
 def analyze(project, logger):
     logger.info("Executing pep8 on project sources")
     _, report_file = execute_tool_on_source_files(project, "pep8", ["pep8"])
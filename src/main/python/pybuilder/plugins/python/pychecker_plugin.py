@@ -17,7 +17,7 @@
 import os
 import re
 
-from pybuilder.core import use_plugin, after, init, task
+from pybuilder.core import use_plugin, after, init, task, inputs, outputs
 from pybuilder.errors import BuildFailedException
 from pybuilder.utils import assert_can_execute, read_file, render_report
 from pybuilder.plugins.python.python_plugin_helper import execute_tool_on_modules
@@ -56,6 +56,9 @@ def build_command_line(project):
 
 
 @task("analyze")
+@inputs("$dir_source_main_python",
+        properties=["pychecker_args", "pychecker_break_build", "pychecker_break_build_threshold"])
+@outputs("$dir_reports/pychecker", "$dir_reports/pychecker.err", "$dir_reports/pychecker.json")
 def execute_pychecker(project, logger):
     command_line = build_command_line(project)
     logger.info("Executing pychecker on project sources: %s" % (' '.join(command_line)))
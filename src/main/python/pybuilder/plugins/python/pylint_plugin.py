@@ -13,7 +13,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from pybuilder.core import use_plugin, after, init, task
+from pybuilder.core import use_plugin, after, init, task, inputs, outputs
 from pybuilder.utils import assert_can_execute
 from pybuilder.plugins.python.python_plugin_helper import execute_tool_on_modules
 
@@ -37,6 +37,8 @@ def check_pylint_availability(logger):
 
 
 @task("analyze")
+@inputs("$dir_source_main_python", properties=["pylint_options"])
+@outputs("$dir_reports/pylint", "$dir_reports/pylint.err")
 def execute_pylint(project, logger):
     logger.info("Executing pylint on project sources")
 
@@ -16,7 +16,7 @@
 
 import os
 
-from pybuilder.core import use_plugin, after, task
+from pybuilder.core import use_plugin, after, task, inputs, outputs
 from pybuilder.utils import assert_can_execute, execute_command
 
 use_plugin("python.core")
@@ -31,6 +31,8 @@ def check_pymetrics_available(logger):
 
 
 @task("analyze")
+@inputs("$dir_source_main_python")
+@outputs("$dir_reports/pymetrics", "$dir_reports/pymetrics.err", "$dir_reports/pymetrics.csv")
 def execute_pymetrics(project, logger):
     logger.info("Executing pymetrics on project sources")
     source_dir = project.expand_path("$dir_source_main_python")
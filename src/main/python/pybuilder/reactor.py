@@ -26,8 +26,11 @@ from pybuilder.core import (TASK_ATTRIBUTE, DEPENDS_ATTRIBUTE,
                             DESCRIPTION_ATTRIBUTE, AFTER_ATTRIBUTE,
                             BEFORE_ATTRIBUTE, INITIALIZER_ATTRIBUTE,
                             ACTION_ATTRIBUTE, ONLY_ONCE_ATTRIBUTE,
+                            INPUTS_ATTRIBUTE, INPUT_PROPERTIES_ATTRIBUTE, OUTPUTS_ATTRIBUTE, CACHEABLE_ATTRIBUTE,
                             Project, NAME_ATTRIBUTE, ENVIRONMENTS_ATTRIBUTE)
+from pybuilder.cache import BuildCache
 from pybuilder.errors import PyBuilderException, ProjectValidationFailedException
+from pybuilder.incremental import IncrementalBuild
 from pybuilder.pluginloader import (BuiltinPluginLoader,
                                     DispatchingPluginLoader,
                                     ThirdPartyPluginLoader)
@@ -106,7 +109,7 @@ class Reactor(object):
 
         self.execution_manager.resolve_dependencies()
 
-    def build(self, tasks=[], environments=[]):
+    def build(self, tasks=[], environments=[], jobs=1, incremental=True, build_cache=True):
         Reactor._current_instance = self
 
         if environments:
@@ -120,6 +123,10 @@ class Reactor(object):
 
         self.validate_project()
 
+        if incremental and self.project.has_property("dir_target"):
+            self.execution_manager.incremental_build = IncrementalBuild(
+                self.logger, self.project, build_cache=BuildCache.for_project(self.project) if build_cache else None)
+
         tasks = as_list(tasks)
 
         if not len(tasks):
@@ -142,8 +149,12 @@ class Reactor(object):
             list_of_tasks = ", ".join(tasks)
             self.logger.info("Going to execute tasks: %s", list_of_tasks)
 
-        task_execution_summaries = self.execution_manager.execute_execution_plan(
+        if jobs > 1:
+            self.logger.info("Executing tasks using up to %d parallel jobs", jobs)
+
+        task_execution_summaries = self.execution_manager.execute_execution_plan_in_parallel(
             execution_plan,
+            jobs,
             logger=self.logger,
             project=self.project,
             reactor=self)
@@ -184,6 +195,10 @@ class Reactor(object):
                 name = candidate.__name__
             description = getattr(candidate, DESCRIPTION_ATTRIBUTE) if hasattr(
                 candidate, DESCRIPTION_ATTRIBUTE) else ""
+            inputs = getattr(candidate, INPUTS_ATTRIBUTE, None)
+            input_properties = getattr(candidate, INPUT_PROPERTIES_ATTRIBUTE, None)
+            outputs = getattr(candidate, OUTPUTS_ATTRIBUTE, None)
+            cacheable = getattr(candidate, CACHEABLE_ATTRIBUTE, False)
 
             if hasattr(candidate, TASK_ATTRIBUTE) and getattr(candidate, TASK_ATTRIBUTE):
                 dependencies = getattr(candidate, DEPENDS_ATTRIBUTE) if hasattr(
@@ -191,7 +206,7 @@ class Reactor(object):
 
                 self.logger.debug("Found task %s", name)
                 self.execution_manager.register_task(
-                    Task(name, candidate, dependencies, description))
+                    Task(name, candidate, dependencies, description, inputs, input_properties, outputs, cacheable))
 
             elif hasattr(candidate, ACTION_ATTRIBUTE) and getattr(candidate, ACTION_ATTRIBUTE):
                 before = getattr(candidate, BEFORE_ATTRIBUTE) if hasattr(
@@ -205,7 +220,8 @@ class Reactor(object):
 
                 self.logger.debug("Found action %s", name)
                 self.execution_manager.register_action(
-                    Action(name, candidate, before, after, description, only_once))
+                    Action(name, candidate, before, after, description, only_once,
+                           inputs, input_properties, outputs, cacheable))
 
             elif hasattr(candidate, INITIALIZER_ATTRIBUTE) and getattr(candidate, INITIALIZER_ATTRIBUTE):
                 environments = []
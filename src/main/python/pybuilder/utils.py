@@ -19,6 +19,7 @@
 """
 
 import fnmatch
+import hashlib
 import json
 import os
 import re
@@ -159,6 +160,17 @@ def write_file(file_name, *lines):
         file_handle.writelines(lines)
 
 
+def hash_file(file_name):
+    """
+    Returns the hex digest of the SHA-1 hash of the content of the given file.
+    """
+    sha1 = hashlib.sha1()
+    with open(file_name, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(65536), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
 class Timer(object):
     @staticmethod
     def start():
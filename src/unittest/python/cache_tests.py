@@ -0,0 +1,131 @@
+#  This file is part of PyBuilder
+#
+#  Copyright 2011-2014 PyBuilder Team
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pybuilder.cache import BuildCache, default_cache_dir
+from pybuilder.core import Project
+
+
+def write(path, content):
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, "w") as file_handle:
+        file_handle.write(content)
+
+
+def read(path):
+    with open(path) as file_handle:
+        return file_handle.read()
+
+
+class BuildCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp(self.__class__.__name__)
+        self.basedir = os.path.join(self.tmp_dir, "project")
+        self.build_cache = BuildCache(os.path.join(self.tmp_dir, "cache"))
+        write(os.path.join(self.basedir, "dist", "spam.py"), "spam")
+        write(os.path.join(self.basedir, "dist", "eggs", "eggs.py"), "eggs")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_should_use_default_cache_dir_when_no_directory_is_given(self):
+        self.assertEquals(default_cache_dir(), BuildCache().directory)
+
+    def test_should_use_cache_dir_and_size_from_project_properties(self):
+        project = Project(self.basedir)
+        project.set_property("build_cache_dir", "/spam")
+        project.set_property("build_cache_max_size_mb", "2")
+
+        build_cache = BuildCache.for_project(project)
+
+        self.assertEquals("/spam", build_cache.directory)
+        self.assertEquals(2 * 1024 * 1024, build_cache.max_size)
+
+    def test_should_not_find_entry_for_unknown_key(self):
+        self.assertEquals(None, self.build_cache.lookup("spam"))
+        self.assertEquals(1, self.build_cache.statistics()["misses"])
+
+    def test_should_restore_stored_files(self):
+        self.build_cache.store("spam", self.basedir, ["dist/spam.py", "dist/eggs/eggs.py"])
+        shutil.rmtree(os.path.join(self.basedir, "dist"))
+
+        entry = self.build_cache.lookup("spam")
+        self.assertTrue(self.build_cache.restore("spam", entry, self.basedir))
+
+        self.assertEquals("spam", read(os.path.join(self.basedir, "dist", "spam.py")))
+        self.assertEquals("eggs", read(os.path.join(self.basedir, "dist", "eggs", "eggs.py")))
+
+    def test_should_store_identical_content_once(self):
+        write(os.path.join(self.basedir, "dist", "eggs", "eggs.py"), "spam")
+
+        self.build_cache.store("spam", self.basedir, ["dist/spam.py", "dist/eggs/eggs.py"])
+
+        statistics = self.build_cache.statistics()
+        self.assertEquals(1, statistics["entries"])
+        self.assertEquals(1, statistics["objects"])
+        self.assertEquals(4, statistics["size"])
+
+    def test_should_not_find_entry_when_object_has_been_removed(self):
+        self.build_cache.store("spam", self.basedir, ["dist/spam.py"])
+        shutil.rmtree(self.build_cache.objects_dir)
+
+        self.assertEquals(None, self.build_cache.lookup("spam"))
+
+    def test_should_count_hits_misses_and_stores(self):
+        self.build_cache.lookup("spam")
+        self.build_cache.store("spam", self.basedir, ["dist/spam.py"])
+        self.build_cache.restore("spam", self.build_cache.lookup("spam"), self.basedir)
+
+        statistics = self.build_cache.statistics()
+        self.assertEquals(1, statistics["hits"])
+        self.assertEquals(1, statistics["misses"])
+        self.assertEquals(1, statistics["stores"])
+        self.assertEquals(0, statistics["evictions"])
+
+    def test_should_evict_least_recently_used_entries_when_exceeding_size_budget(self):
+        self.build_cache.max_size = 8
+        self.build_cache.store("spam", self.basedir, ["dist/spam.py"])
+        self.build_cache.store("eggs", self.basedir, ["dist/eggs/eggs.py"])
+        past = time.time() - 60
+        os.utime(self.build_cache.entry_file("eggs"), (past, past))
+        self.build_cache.restore("spam", self.build_cache.lookup("spam"), self.basedir)
+
+        write(os.path.join(self.basedir, "dist", "ham.py"), "ham")
+        self.build_cache.store("ham", self.basedir, ["dist/ham.py"])
+
+        self.assertNotEqual(None, self.build_cache.lookup("spam"))
+        self.assertEquals(None, self.build_cache.lookup("eggs"))
+        self.assertNotEqual(None, self.build_cache.lookup("ham"))
+        statistics = self.build_cache.statistics()
+        self.assertEquals(1, statistics["evictions"])
+        self.assertEquals(7, statistics["size"])
+
+    def test_should_keep_objects_referenced_by_remaining_entries_when_evicting(self):
+        self.build_cache.store("spam", self.basedir, ["dist/spam.py", "dist/eggs/eggs.py"])
+        past = time.time() - 60
+        os.utime(self.build_cache.entry_file("spam"), (past, past))
+        self.build_cache.max_size = 4
+        self.build_cache.store("eggs", self.basedir, ["dist/spam.py"])
+
+        self.assertEquals(None, self.build_cache.lookup("spam"))
+        self.assertNotEqual(None, self.build_cache.lookup("eggs"))
+        self.assertEquals(1, self.build_cache.statistics()["objects"])
@@ -81,6 +81,10 @@ class ParseOptionsTest (unittest.TestCase):
                           overrides.get("property_overrides", {}))
         self.assertEquals(options.start_project,
                           overrides.get("start_project", False))
+        self.assertEquals(options.jobs,
+                          overrides.get("jobs", 1))
+        self.assertEquals(options.cache_stats,
+                          overrides.get("cache_stats", False))
 
     def test_should_parse_empty_arguments(self):
         options, arguments = parse_options([])
@@ -148,6 +152,22 @@ class ParseOptionsTest (unittest.TestCase):
         self.assert_options(options, environments=[])
         self.assertEquals([], arguments)
 
+    def test_should_parse_number_of_jobs(self):
+        options, arguments = parse_options(["-j", "4", "spam"])
+
+        self.assert_options(options, jobs=4)
+        self.assertEquals(["spam"], arguments)
+
+    def test_should_abort_execution_when_number_of_jobs_is_less_than_one(self):
+        self.assertRaises(
+            CommandLineUsageException, parse_options, ["--jobs", "0"])
+
+    def test_should_parse_cache_stats(self):
+        options, arguments = parse_options(["--cache-stats"])
+
+        self.assert_options(options, cache_stats=True)
+        self.assertEquals([], arguments)
+
 
 class LengthOfLongestStringTests(unittest.TestCase):
 
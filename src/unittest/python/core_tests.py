@@ -20,7 +20,8 @@ import unittest
 from pyassert import assert_that
 from mockito import when, verify, unstub
 
-from pybuilder.core import Project, Logger, init, INITIALIZER_ATTRIBUTE, ENVIRONMENTS_ATTRIBUTE
+from pybuilder.core import (Project, Logger, init, inputs, outputs, INITIALIZER_ATTRIBUTE, ENVIRONMENTS_ATTRIBUTE,
+                            INPUTS_ATTRIBUTE, INPUT_PROPERTIES_ATTRIBUTE, OUTPUTS_ATTRIBUTE)
 from pybuilder.errors import MissingPropertyException
 
 
@@ -445,3 +446,31 @@ class InitTest(unittest.TestCase):
         self.assertTrue(getattr(fun, ENVIRONMENTS_ATTRIBUTE), ["spam"])
 
         self.assertTrue(is_callable(fun))
+
+
+class InputsAndOutputsTest(unittest.TestCase):
+
+    def test_should_declare_input_globs_and_properties(self):
+        @inputs("$dir_source_main_python", "*.cfg", properties=["spam", "eggs"])
+        def fun():
+            pass
+
+        self.assertEquals(["$dir_source_main_python", "*.cfg"], getattr(fun, INPUTS_ATTRIBUTE))
+        self.assertEquals(["spam", "eggs"], getattr(fun, INPUT_PROPERTIES_ATTRIBUTE))
+        self.assertTrue(is_callable(fun))
+
+    def test_should_declare_single_input_property(self):
+        @inputs(properties="spam")
+        def fun():
+            pass
+
+        self.assertEquals([], getattr(fun, INPUTS_ATTRIBUTE))
+        self.assertEquals(["spam"], getattr(fun, INPUT_PROPERTIES_ATTRIBUTE))
+
+    def test_should_declare_output_globs(self):
+        @outputs("$dir_dist")
+        def fun():
+            pass
+
+        self.assertEquals(["$dir_dist"], getattr(fun, OUTPUTS_ATTRIBUTE))
+        self.assertTrue(is_callable(fun))
@@ -14,6 +14,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from mockito import verify, unstub, any, times, when
+import threading
+import sys
 import unittest
 from test_utils import mock
 
@@ -562,6 +564,61 @@ class ExecutionManagerBuildExecutionPlanTest(ExecutionManagerTestBase):
         self.assertRaises(CircularTaskDependencyException,
                           self.execution_manager.build_execution_plan, ["one"])
 
+    def test_should_report_full_path_of_circular_reference(self):
+        one = mock(name="one", dependencies=["two"])
+        two = mock(name="two", dependencies=["three"])
+        three = mock(name="three", dependencies=["four"])
+        four = mock(name="four", dependencies=["two"])
+
+        self.execution_manager.register_task(one, two, three, four)
+        self.execution_manager.resolve_dependencies()
+
+        try:
+            self.execution_manager.build_execution_plan(["one"])
+            self.fail("CircularTaskDependencyException expected")
+        except CircularTaskDependencyException as e:
+            self.assertEquals(["two", "three", "four", "two"], e.cycle)
+            self.assertEquals("Circular task dependency detected: two -> three -> four -> two", str(e))
+
+    def test_should_return_execution_plan_for_diamond_dependencies(self):
+        one = mock(name="one", dependencies=[])
+        two = mock(name="two", dependencies=["one"])
+        three = mock(name="three", dependencies=["one"])
+        four = mock(name="four", dependencies=["two", "three"])
+
+        self.execution_manager.register_task(one, two, three, four)
+        self.execution_manager.resolve_dependencies()
+
+        self.assertEqual(
+            [one, two, three, four], self.execution_manager.build_execution_plan(["four", "three"]))
+
+    def test_should_return_execution_plan_for_dependency_chain_exceeding_recursion_limit(self):
+        tasks = [mock(name="task_0", dependencies=[])]
+        for number in range(1, sys.getrecursionlimit() * 2):
+            tasks.append(mock(name="task_%d" % number, dependencies=["task_%d" % (number - 1)]))
+
+        self.execution_manager.register_task(*tasks)
+        self.execution_manager.resolve_dependencies()
+
+        self.assertEqual(tasks, self.execution_manager.build_execution_plan([tasks[-1].name]))
+
+    def test_should_return_execution_plan_for_large_generated_task_graph(self):
+        tasks = []
+        for number in range(50000):
+            dependencies = ["task_%d" % (number // divisor) for divisor in (2, 3, 5) if number // divisor < number]
+            tasks.append(mock(name="task_%d" % number, dependencies=dependencies))
+
+        self.execution_manager.register_task(*tasks)
+        self.execution_manager.resolve_dependencies()
+
+        execution_plan = self.execution_manager.build_execution_plan([task.name for task in reversed(tasks)])
+
+        self.assertEqual(len(tasks), len(execution_plan))
+        positions = dict((task.name, position) for position, task in enumerate(execution_plan))
+        for task in tasks:
+            for dependency in task.dependencies:
+                self.assertTrue(positions[dependency] < positions[task.name])
+
 
 class ExecutionManagerExecuteExecutionPlanTest(ExecutionManagerTestBase):
 
@@ -580,3 +637,80 @@ class ExecutionManagerExecuteExecutionPlanTest(ExecutionManagerTestBase):
 
         verify(one).execute(any(), {})
         verify(two).execute(any(), {})
+
+
+class ExecutionManagerExecuteExecutionPlanInParallelTest(ExecutionManagerTestBase):
+
+    def test_should_execute_tasks_and_return_summaries_in_order_of_execution_plan(self):
+        one = Task("one", lambda: None)
+        two = Task("two", lambda: None)
+
+        self.execution_manager.register_task(one, two)
+        self.execution_manager.resolve_dependencies()
+
+        summaries = self.execution_manager.execute_execution_plan_in_parallel([one, two], 2)
+
+        self.assertEquals(["one", "two"], [summary.task for summary in summaries])
+
+    def test_should_execute_independent_tasks_concurrently(self):
+        two_started = threading.Event()
+
+        def wait_for_two():
+            two_started.wait(5)
+            if not two_started.is_set():
+                raise AssertionError("Task two has not been started concurrently")
+
+        one = Task("one", wait_for_two)
+        two = Task("two", lambda: two_started.set())
+
+        self.execution_manager.register_task(one, two)
+        self.execution_manager.resolve_dependencies()
+
+        self.execution_manager.execute_execution_plan_in_parallel([one, two], 2)
+
+        self.assertTrue(two_started.is_set())
+
+    def test_should_execute_dependencies_before_dependent_task(self):
+        executed = []
+        one = Task("one", lambda: executed.append("one"))
+        two = Task("two", lambda: executed.append("two"), "one")
+        three = Task("three", lambda: executed.append("three"), "two")
+
+        self.execution_manager.register_task(one, two, three)
+        self.execution_manager.resolve_dependencies()
+
+        self.execution_manager.execute_execution_plan_in_parallel(
+            self.execution_manager.build_execution_plan("three"), 4)
+
+        self.assertEquals(["one", "two", "three"], executed)
+
+    def test_should_raise_exception_and_not_execute_dependent_tasks_when_task_fails(self):
+        executed = []
+
+        def fail():
+            raise ValueError("boom")
+
+        one = Task("one", fail)
+        two = Task("two", lambda: executed.append("two"), "one")
+
+        self.execution_manager.register_task(one, two)
+        self.execution_manager.resolve_dependencies()
+
+        self.assertRaises(ValueError,
+                          self.execution_manager.execute_execution_plan_in_parallel,
+                          self.execution_manager.build_execution_plan("two"), 2)
+        self.assertEquals([], executed)
+
+    def test_should_execute_action_marked_as_only_once_only_once_when_tasks_run_concurrently(self):
+        executed = []
+        spam = Task("spam", lambda: None)
+        eggs = Task("eggs", lambda: None)
+        action = Action("action", lambda: executed.append("action"), after=["spam", "eggs"], only_once=True)
+
+        self.execution_manager.register_task(spam, eggs)
+        self.execution_manager.register_action(action)
+        self.execution_manager.resolve_dependencies()
+
+        self.execution_manager.execute_execution_plan_in_parallel([spam, eggs], 2)
+
+        self.assertEquals(["action"], executed)
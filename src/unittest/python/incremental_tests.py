@@ -0,0 +1,268 @@
+#  This file is part of PyBuilder
+#
+#  Copyright 2011-2014 PyBuilder Team
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import shutil
+import tempfile
+import unittest
+
+from pybuilder.cache import BuildCache
+from pybuilder.core import Logger, Project
+from pybuilder.execution import Executable, ExecutionManager, Task
+from pybuilder.incremental import (IncrementalBuild,
+                                   discover_files_matching_glob,
+                                   expand_globs,
+                                   fingerprint_properties)
+
+
+def touch(*path_elements):
+    path = os.path.join(*path_elements)
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, "w") as file_handle:
+        file_handle.write(path)
+
+
+class IncrementalBuildTestBase(unittest.TestCase):
+
+    def setUp(self):
+        self.basedir = tempfile.mkdtemp(self.__class__.__name__)
+        self.project = Project(self.basedir)
+        self.project.set_property("dir_target", "target")
+        self.project.set_property("dir_source", "src")
+        self.project.set_property("dir_dist", "$dir_target/dist")
+
+    def tearDown(self):
+        shutil.rmtree(self.basedir)
+
+
+class ExpandGlobsTest(IncrementalBuildTestBase):
+
+    def test_should_expand_properties(self):
+        self.assertEquals(["target/dist/*.py"], expand_globs(self.project, "$dir_dist/*.py"))
+
+    def test_should_expand_list_property_to_one_glob_per_element(self):
+        self.project.set_property("globs", ["*.py", "*.txt"])
+
+        self.assertEquals(["target/*.py", "target/*.txt"], expand_globs(self.project, "$dir_target/$globs"))
+
+
+class DiscoverFilesMatchingGlobTest(IncrementalBuildTestBase):
+
+    def test_should_return_all_files_below_directory_when_glob_names_directory(self):
+        touch(self.basedir, "src", "spam.py")
+        touch(self.basedir, "src", "eggs", "eggs.py")
+
+        self.assertEquals(["src/eggs/eggs.py", "src/spam.py"],
+                          sorted(discover_files_matching_glob(self.basedir, "src")))
+
+    def test_should_return_single_file_when_glob_names_file(self):
+        touch(self.basedir, "src", "spam.py")
+
+        self.assertEquals(["src/spam.py"], discover_files_matching_glob(self.basedir, "src/spam.py"))
+
+    def test_should_return_matching_files_only(self):
+        touch(self.basedir, "src", "spam.py")
+        touch(self.basedir, "src", "spam.txt")
+
+        self.assertEquals(["src/spam.py"], discover_files_matching_glob(self.basedir, "src/*.py"))
+
+    def test_should_return_nothing_when_directory_does_not_exist(self):
+        self.assertEquals([], discover_files_matching_glob(self.basedir, "src/*.py"))
+
+
+class FingerprintPropertiesTest(IncrementalBuildTestBase):
+
+    def test_should_fingerprint_properties_and_project_attributes(self):
+        self.project.summary = "summary"
+
+        fingerprint = fingerprint_properties(self.project, ["dir_source", "summary", "unknown"])
+
+        self.assertEquals({"dir_source": '"src"', "summary": '"summary"', "unknown": "null"}, fingerprint)
+
+    def test_should_fingerprint_sets_independent_of_order(self):
+        self.project.depends_on("spam")
+        self.project.depends_on("eggs")
+        first = fingerprint_properties(self.project, ["dependencies"])
+
+        self.project._install_dependencies = set(reversed(sorted(self.project._install_dependencies)))
+
+        self.assertEquals(first, fingerprint_properties(self.project, ["dependencies"]))
+
+
+class IncrementalBuildTest(IncrementalBuildTestBase):
+
+    def setUp(self):
+        super(IncrementalBuildTest, self).setUp()
+        self.executions = []
+        touch(self.basedir, "src", "spam.py")
+
+        def package():
+            self.executions.append("package")
+            touch(self.basedir, "target", "dist", "spam.py")
+
+        self.executable = Executable("package", package, inputs=["$dir_source"], outputs=["$dir_dist"])
+
+    def execute(self):
+        incremental_build = IncrementalBuild(Logger(), self.project)
+        incremental_build.begin_task()
+        incremental_build.execute(self.executable, {})
+        incremental_build.finish_task()
+
+    def test_should_execute_executable_when_it_has_not_been_executed_before(self):
+        self.execute()
+
+        self.assertEquals(["package"], self.executions)
+        self.assertTrue(os.path.exists(os.path.join(self.basedir, "target", "build_state.json")))
+
+    def test_should_skip_executable_when_inputs_and_outputs_have_not_changed(self):
+        self.execute()
+        self.execute()
+
+        self.assertEquals(["package"], self.executions)
+
+    def test_should_execute_executable_when_input_file_has_been_added(self):
+        self.execute()
+        touch(self.basedir, "src", "eggs.py")
+        self.execute()
+
+        self.assertEquals(["package", "package"], self.executions)
+
+    def test_should_execute_executable_when_input_property_has_changed(self):
+        self.executable.input_properties = ["spam"]
+        self.execute()
+        self.project.set_property("spam", "eggs")
+        self.execute()
+
+        self.assertEquals(["package", "package"], self.executions)
+
+    def test_should_execute_executable_when_output_has_been_removed(self):
+        self.execute()
+        os.remove(os.path.join(self.basedir, "target", "dist", "spam.py"))
+        self.execute()
+
+        self.assertEquals(["package", "package"], self.executions)
+
+    def test_should_skip_executable_when_file_has_been_added_to_output_directory(self):
+        self.execute()
+        touch(self.basedir, "target", "dist", "eggs.py")
+        self.execute()
+
+        self.assertEquals(["package"], self.executions)
+
+    def test_should_always_execute_executable_without_outputs(self):
+        self.executable.outputs = []
+        self.execute()
+        self.execute()
+
+        self.assertEquals(["package", "package"], self.executions)
+
+    def test_should_not_record_executable_when_task_is_aborted(self):
+        incremental_build = IncrementalBuild(Logger(), self.project)
+        incremental_build.begin_task()
+        incremental_build.execute(self.executable, {})
+        incremental_build.abort_task()
+        self.execute()
+
+        self.assertEquals(["package", "package"], self.executions)
+
+
+class IncrementalBuildWithBuildCacheTest(IncrementalBuildTestBase):
+
+    def setUp(self):
+        super(IncrementalBuildWithBuildCacheTest, self).setUp()
+        self.executions = []
+        touch(self.basedir, "src", "spam.py")
+
+        def package():
+            self.executions.append("package")
+            touch(self.basedir, "target", "dist", "spam.py")
+
+        self.executable = Executable("package", package, inputs=["$dir_source"], outputs=["$dir_dist"],
+                                     cacheable=True)
+        self.build_cache = BuildCache(tempfile.mkdtemp(self.__class__.__name__))
+
+    def tearDown(self):
+        super(IncrementalBuildWithBuildCacheTest, self).tearDown()
+        shutil.rmtree(self.build_cache.directory)
+
+    def execute(self):
+        incremental_build = IncrementalBuild(Logger(), self.project, build_cache=self.build_cache)
+        incremental_build.begin_task()
+        incremental_build.execute(self.executable, {})
+        incremental_build.finish_task()
+
+    def test_should_restore_outputs_from_cache_when_output_has_been_removed(self):
+        self.execute()
+        os.remove(os.path.join(self.basedir, "target", "dist", "spam.py"))
+        self.execute()
+
+        self.assertEquals(["package"], self.executions)
+        self.assertTrue(os.path.exists(os.path.join(self.basedir, "target", "dist", "spam.py")))
+
+    def test_should_restore_outputs_from_cache_when_build_state_has_been_removed(self):
+        self.execute()
+        shutil.rmtree(os.path.join(self.basedir, "target"))
+        self.execute()
+
+        self.assertEquals(["package"], self.executions)
+        self.assertTrue(os.path.exists(os.path.join(self.basedir, "target", "dist", "spam.py")))
+        self.assertEquals(1, self.build_cache.statistics()["hits"])
+
+    def test_should_restore_outputs_from_cache_when_input_has_been_reverted(self):
+        self.execute()
+        touch(self.basedir, "src", "eggs.py")
+        self.execute()
+        os.remove(os.path.join(self.basedir, "src", "eggs.py"))
+        self.execute()
+
+        self.assertEquals(["package", "package"], self.executions)
+
+    def test_should_remove_stale_outputs_when_restoring_from_cache(self):
+        self.execute()
+        os.remove(os.path.join(self.basedir, "target", "build_state.json"))
+        touch(self.basedir, "target", "dist", "stale.py")
+        self.execute()
+
+        self.assertFalse(os.path.exists(os.path.join(self.basedir, "target", "dist", "stale.py")))
+
+    def test_should_not_use_cache_for_executable_which_is_not_cacheable(self):
+        self.executable.cacheable = False
+        self.execute()
+        shutil.rmtree(os.path.join(self.basedir, "target"))
+        self.execute()
+
+        self.assertEquals(["package", "package"], self.executions)
+        self.assertEquals(0, self.build_cache.statistics()["stores"])
+
+
+class ExecutionManagerIncrementalBuildTest(IncrementalBuildTestBase):
+
+    def test_should_skip_up_to_date_task_executables(self):
+        executions = []
+
+        def package():
+            executions.append("package")
+            touch(self.basedir, "target", "dist", "spam.py")
+
+        for _ in range(2):
+            execution_manager = ExecutionManager(Logger())
+            execution_manager.incremental_build = IncrementalBuild(Logger(), self.project)
+            task = Task("package", package, outputs=["$dir_dist"])
+            execution_manager.register_task(task)
+            execution_manager.resolve_dependencies()
+            execution_manager.execute_execution_plan([task])
+
+        self.assertEquals(["package"], executions)